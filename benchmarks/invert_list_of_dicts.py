@@ -0,0 +1,58 @@
+"""
+Compare memory use of the default and compact outputs of
+`utils.core.invert_list_of_dicts` on JSON-like API records.
+
+Run with `python benchmarks/invert_list_of_dicts.py [records]`.
+"""
+
+import gc
+import json
+import random
+import sys
+import tracemalloc
+
+from utils.core import invert_list_of_dicts
+
+STATUSES = ['ok', 'error', 'pending', 'failed']
+STATES = ['Maine', 'Ohio', 'Texas', 'Iowa', 'Utah']
+
+def make_payload(records: int) -> str:
+    """Serialize records with low-cardinality strings and nullable numbers."""
+    random.seed(0)
+    rows = [
+        {
+            'id': i,
+            'score': random.choice([random.random(), 1, None]),
+            'status': random.choice(STATUSES),
+            'state': random.choice(STATES)
+        }
+        for i in range(records)
+        ]
+    return json.dumps(rows)
+
+def measure(payload: str, compact: bool) -> tuple[float, float]:
+    """Return retained and peak traced memory in MB for one inversion."""
+    gc.collect()
+    tracemalloc.start()
+    rows = json.loads(payload)
+    tracemalloc.reset_peak()
+    parsed = tracemalloc.get_traced_memory()[0]
+    result = invert_list_of_dicts(rows, compact=compact)
+    peak = tracemalloc.get_traced_memory()[1] - parsed
+    del rows
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return retained / 1e6, peak / 1e6
+
+if __name__ == '__main__':
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    payload = make_payload(records)
+    print(f'{records:,} records')
+    for compact in (False, True):
+        retained, peak = measure(payload, compact)
+        print(
+            f'compact={compact!s:<5}  retained {retained:7.1f} MB  '
+            f'peak above input {peak:7.1f} MB'
+            )
@@ -11,6 +11,8 @@ from typing import List, Callable, Any
 from functools import reduce
 from itertools import chain
 from collections import defaultdict
+from array import array
+from math import nan
 import re
 
 def chain_operations(arg, order_of_operations: List[Callable]):
@@ -81,23 +83,70 @@ def flatten_nested_list(items: List[Any|List[Any]]) -> List:
             )
         )
 
-def invert_list_of_dicts(dictionaries: list[dict]):
+def invert_list_of_dicts(dictionaries: list[dict], compact: bool = False) -> dict:
     """Efficiently convert a list of dictionaries into a dictionary of lists.
-    
+
+    With `compact=True`, numeric columns are packed into typed arrays and
+    repeated strings share a single object.
+
     Args:
         dictionaries: A list of dictionaries
-        
+        compact: Return memory-efficient columns. Defaults to `False`
+
     Returns:
         A dictionary with one item for each unique key
-        
+
     Examples:
         >>> invert_list_of_dicts([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}])
         {'a': [1, 3], 'b': [2, 4]}
         >>> invert_list_of_dicts([{'a': 1, 'b': 2}, {'a': 3, 'c': 4}])
         {'a': [1, 3], 'b': [2], 'c': [4]}
+        >>> invert_list_of_dicts([{'a': 1, 'b': 'x'}, {'a': 3, 'b': 'y'}], compact=True)
+        {'a': array('q', [1, 3]), 'b': ['x', 'y']}
+        >>> invert_list_of_dicts([{'a': 1}, {'a': 2.5}, {'a': None}], compact=True)
+        {'a': array('d', [1.0, 2.5, nan])}
     """
+    if compact:
+        keys = dict.fromkeys(chain.from_iterable(dictionaries))
+        return {
+            key: _compact_column([d[key] for d in dictionaries if key in d])
+            for key in keys
+            }
     result = defaultdict(list)
     for dictionary in dictionaries:
         for key, value in dictionary.items():
             result[key].append(value)
-    return dict(result)
\ No newline at end of file
+    return dict(result)
+
+def _compact_column(values: list) -> array | list:
+    """Pack a column into a typed array, or deduplicate its strings.
+
+    Columns of ints become `array('q')`. Columns of ints, floats and `None`
+    become `array('d')` with `None` stored as NaN, provided every int is
+    exactly representable as a float and the column has no NaN of its own.
+    Any other column is returned as a list, with equal strings sharing the
+    first occurrence.
+    """
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return array('q', values)
+        except OverflowError:
+            pass
+    if types & {int, float} and types <= {int, float, type(None)}:
+        if all(map(_packs_as_float, values)):
+            return array('d', (nan if v is None else v for v in values))
+    seen: dict[str, str] = {}
+    for i, value in enumerate(values):
+        if type(value) is str:
+            values[i] = seen.setdefault(value, value)
+    return values
+
+def _packs_as_float(value: int | float | None) -> bool:
+    """Check whether a value survives a round trip through `array('d')`."""
+    if value is None:
+        return True
+    try:
+        return float(value) == value
+    except OverflowError:
+        return False
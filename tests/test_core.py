@@ -1,4 +1,7 @@
+import math
+import sys
 import unittest
+from array import array
 from utils.core import core
 
 class TestChainOperations(unittest.TestCase):
@@ -32,5 +35,68 @@ class TestFlattenNestedList(unittest.TestCase):
         result = core.flatten_nested_list([None, [[False]], [1], 'a'])
         self.assertEqual(result, [None, False, 1, 'a'])
 
+class TestInvertListOfDicts(unittest.TestCase):
+    def test_invert_list_of_dicts(self):
+        result = core.invert_list_of_dicts([{'a': 1, 'b': 2}, {'a': 3, 'c': 4}])
+        self.assertEqual(result, {'a': [1, 3], 'b': [2], 'c': [4]})
+
+    def test_compact_numeric_columns(self):
+        result = core.invert_list_of_dicts(
+            [{'a': 1, 'b': 0.5}, {'a': 3, 'b': 1.5}], compact=True
+            )
+        self.assertEqual(result['a'], array('q', [1, 3]))
+        self.assertEqual(result['b'], array('d', [0.5, 1.5]))
+
+    def test_compact_deduplicates_strings(self):
+        dictionaries = [{'a': ''.join(['o', 'k'])} for _ in range(3)]
+        self.assertIsNot(dictionaries[0]['a'], dictionaries[2]['a'])
+        result = core.invert_list_of_dicts(dictionaries, compact=True)
+        self.assertEqual(result['a'], ['ok', 'ok', 'ok'])
+        self.assertIs(result['a'][0], result['a'][2])
+
+    def test_compact_high_cardinality_strings(self):
+        dictionaries = [{'u': f'id-{i}'} for i in range(1000)]
+        sample = dictionaries[500]['u']
+        refcount = sys.getrefcount(sample)
+        result = core.invert_list_of_dicts(dictionaries, compact=True)
+        self.assertEqual(result['u'], [d['u'] for d in dictionaries])
+        del result
+        self.assertEqual(sys.getrefcount(sample), refcount)
+
+    def test_compact_unpackable_columns(self):
+        result = core.invert_list_of_dicts(
+            [{'a': 1, 'b': True, 'c': 2**70 + 1}, {'a': 'x', 'b': False, 'c': 0.5}],
+            compact=True
+            )
+        self.assertEqual(
+            result, {'a': [1, 'x'], 'b': [True, False], 'c': [2**70 + 1, 0.5]}
+            )
+
+    def test_compact_mixed_numeric_column(self):
+        result = core.invert_list_of_dicts([{'a': 1}, {'a': 1.5}], compact=True)
+        self.assertEqual(result['a'], array('d', [1.0, 1.5]))
+
+    def test_compact_nullable_numeric_column(self):
+        result = core.invert_list_of_dicts(
+            [{'a': 1}, {'a': None}, {'a': 3}], compact=True
+            )
+        self.assertEqual(result['a'].typecode, 'd')
+        self.assertEqual(result['a'][::2], array('d', [1.0, 3.0]))
+        self.assertTrue(math.isnan(result['a'][1]))
+
+    def test_compact_nullable_column_with_nan(self):
+        result = core.invert_list_of_dicts(
+            [{'a': float('nan')}, {'a': None}], compact=True
+            )
+        self.assertIsInstance(result['a'], list)
+        self.assertIsNone(result['a'][1])
+
+    def test_compact_preserves_key_order(self):
+        result = core.invert_list_of_dicts(
+            [{'b': 1}, {'a': 'x', 'b': 2}], compact=True
+            )
+        self.assertEqual(list(result), ['b', 'a'])
+        self.assertEqual(result['a'], ['x'])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file